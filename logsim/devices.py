@@ -104,6 +104,7 @@ class Devices:
         self.names = names
 
         self.devices_list = []
+        self.devices_dict = {}  # maps each device ID to its Device object
 
         gate_strings = ["AND", "OR", "NAND", "NOR", "XOR"]
         device_strings = ["CLOCK", "SWITCH", "DTYPE", "SIGGEN"]
@@ -129,10 +130,7 @@ class Devices:
 
     def get_device(self, device_id):
         """Return the Device object corresponding to device_id."""
-        for device in self.devices_list:
-            if device.device_id == device_id:
-                return device
-        return None
+        return self.devices_dict.get(device_id)
 
     def find_devices(self, device_kind=None):
         """Return a list of device IDs of the specified device_kind.
@@ -153,6 +151,7 @@ class Devices:
         new_device = Device(device_id)
         new_device.device_kind = device_kind
         self.devices_list.append(new_device)
+        self.devices_dict[device_id] = new_device
 
     def add_input(self, device_id, input_id):
         """Add the specified input to the specified device.
@@ -192,7 +191,7 @@ class Devices:
                 return signal_name
             elif port_id in device.outputs or port_id in device.inputs:
                 port_name = self.names.get_name_string(port_id)
-                signal_name = ".".join([device_name, port_name])
+                signal_name = f"{device_name}.{port_name}"
                 return signal_name
             else:
                 return None
@@ -259,7 +258,7 @@ class Devices:
         self.add_output(device_id, output_id=None)
 
         for input_number in range(1, no_of_inputs + 1):
-            input_name = "".join(["I", str(input_number)])
+            input_name = f"I{input_number}"
             [input_id] = self.names.lookup([input_name])
             self.add_input(device_id, input_id)
 
@@ -18,24 +18,28 @@ catalog.
 
 """
 
+import importlib
 import os
 import sys
-import subprocess
 import wx
 
 appFolder = os.getcwd()
 
 # setup some stuff to get at Python I18N tools/utilities
 
-pyExe = sys.executable
-pyFolder = os.path.split(pyExe)[0]
+pyFolder = os.path.split(sys.executable)[0]
 pyToolsFolder = os.path.join(pyFolder, 'Tools')
 pyI18nFolder = os.path.join(pyToolsFolder, 'i18n')
 pyGettext = os.path.join(pyI18nFolder, 'pygettext.py')
-pyMsgfmt = os.path.join(pyI18nFolder, 'msgfmt.py')
 outFolder = os.path.join(appFolder, 'locale')
 
-tCmd = pyExe + ' ' + pyGettext + ' ' + "-o jap.po gui.py"
+# import the tools as modules so they run in this interpreter rather than
+# starting a new one for each step
+sys.path.insert(0, pyI18nFolder)
+pygettext = importlib.import_module('pygettext')
+msgfmt = importlib.import_module('msgfmt')
+
+gtArgs = ["-o", "jap.po", "gui.py"]
 
 # build command for pygettext
 #gtOptions = '-a -d %s -o %s.pot -p %s %s'
@@ -44,18 +48,23 @@ tCmd = pyExe + ' ' + pyGettext + ' ' + "-o jap.po gui.py"
                                                     # outFolder,
                                                    #  appFolder))
 print ("Generating the .pot file")
-print ("cmd: %s" % tCmd)
-rCode = subprocess.call(tCmd)
-print ("return code: %s\n\n" % rCode)
+print ("args: %s" % gtArgs)
+# pygettext reads its options from argv, so it is only replaced for the call
+savedArgv = sys.argv
+sys.argv = [pyGettext] + gtArgs
+try:
+    pygettext.main()
+finally:
+    sys.argv = savedArgv
+print ("done\n\n")
 
 
 tLang = wx.LANGUAGE_JAPANESE
 # build command for msgfmt
 langDir = os.path.join(appFolder, ('locale'))
 poFile = os.path.join(langDir, "jap" + '.po')
-tCmd = pyExe + ' ' + pyMsgfmt + ' ' + poFile
-    
+
 print ("Generating the .mo file")
-print ("cmd: %s" % tCmd)
-rCode = subprocess.call(tCmd)
-print ("return code: %s\n\n" % rCode)
+print ("file: %s" % poFile)
+msgfmt.make(poFile, None)
+print ("done\n\n")
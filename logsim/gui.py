@@ -9,26 +9,54 @@ MyGLCanvas - handles all canvas drawing operations.
 Gui - configures the main window and all the widgets.
 """
 import wx
-import gettext
 
 import wx.glcanvas as wxcanvas
 import numpy as np
 import math
-import os
+import ctypes
+import re
 
 from OpenGL import GL, GLU, GLUT
-from wx.core import BoxSizer, LANGUAGE_JAPANESE
 
+# characters which cannot appear in a device or port name, apart from the
+# '.' separating them
+NOT_NAME_CHARACTER = re.compile(r'[^A-Za-z0-9.]')
 
-import sys
+# the EBNF rules are not translated, so they are only built once on import
+EBNF_TEXT = """EBNF RULES:
 
-from names import Names
-from devices import Devices
-from network import Network
-from monitors import Monitors
-from scanner import Scanner
-from parse import Parser
-import builtins
+digit = “0” | “1” | “2” | “3” | “4” | “5” | “6” | “7” | “8” | “9” ;
+
+letter = "A" | "B" | "C" | "D" | "E" | "F" | "G"
+       | "H" | "I" | "J" | "K" | "L" | "M" | "N"
+       | "O" | "P" | "Q" | "R" | "S" | "T" | "U"
+       | "V" | "W" | "X" | "Y" | "Z" | "a" | "b"
+       | "c" | "d" | "e" | "f" | "g" | "h" | "i"
+       | "j" | "k" | "l" | "m" | "n" | "o" | "p"
+       | "q" | "r" | "s" | "t" | "u" | "v" | "w"
+       | "x" | "y" | "z" ;
+
+file = {definition | connection | monitor}, "END" ;
+
+definition =  “define”, name, {name}, “as”,
+ ( “XOR” | “DTYPE” | switch | gate | clock | generator), “;” ;
+name = letter, {letter | digit} ;
+switch = “SWITCH”, (“0” | “1”), “state” ;
+gate = (“NAND” | “AND” | “OR” | “NOR” ), digit, {digit}, “inputs”;
+clock = “CLOCK”, “period”, digit, {digit} ;
+generator = "SIGGEN", ("0"|"1"), "for", digit, {digit}, "cycles",
+{("0" | "1"), "for", digit, {digit}, "cycles"} ;
+
+connection = “connect”, output, “to”, input, “;” ;
+output = name, [“.Q” | “.QBAR”] ;
+input = name, “.”, (“DATA” | “CLK” | “SET” | “CLEAR” | “I”, digit, {digit}) ;
+
+monitor = “monitor”, output, {output}, “;” ;
+
+Comments:
+Line comments must be started with a '%' and ended by a newline.
+Paragraph comments must be enclosed between two '#' characters.
+"""
 
 
 class MyGLCanvas(wxcanvas.GLCanvas):
@@ -47,15 +75,54 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     --------------
     reset_tranformation_variables(self): Resets variables to init state
 
+    set_mode(self, choose_3D): Switches between the 2D and 3D view.
+
     init_gl(self): Configures the OpenGL context.
 
     render(self): Handles all drawing operations.
 
-    draw_cuboid(self, x_pos, z_pos, half_width, half_depth, height): Renders
-                            a cuboid in 3D view at the specified coordinates.
+    get_trace_vertices(self, signals, margin): Returns the vertex array of
+                       every monitor's 2D signal trace and their vertex counts.
+
+    get_trace_buffer(self, margin): Returns the vertex buffer holding every
+                                    monitor's 2D signal trace.
+
+    get_trace_list(self, margin): Returns the display list drawing every
+                                  monitor's 2D signal trace, used when vertex
+                                  buffers are not available.
+
+    get_signal_array(self, device_id, output_id, signal_list): Returns the
+                     cached uint8 array encoding of a monitor's signal list.
+
+    get_signal_matrix(self): Returns the signal lists of all monitors as the
+                             rows of a uint8 matrix.
+
+    clear_signal_arrays(self): Discards cached signal arrays.
+
+    clear_trace_cache(self): Discards cached 2D and 3D trace geometry.
+
+    get_signal_name(self, device_id, output_id): Returns the cached name of a
+                                                 monitored signal.
+
+    clear_name_cache(self): Discards cached signal names.
+
+    get_cuboid_geometry(self, signals): Returns the monitor rows, z positions
+                                        and heights of all the cuboids.
+
+    get_cuboid_mesh(self, signals, x_positions): Returns the merged cuboid
+                    mesh of every monitor's 3D trace.
+
+    get_cuboid_buffer(self, x_positions): Returns the vertex buffer holding
+                                          every monitor's 3D cuboids.
+
+    get_cuboid_list(self, x_positions): Returns the display list drawing
+                                        every monitor's 3D cuboids, used when
+                                        vertex buffers are not available.
 
     on_paint(self, event): Handles the paint event.
 
+    on_erase_background(self, event): Handles the erase background event.
+
     on_size(self, event): Handles the canvas resize event.
 
     on_mouse(self, event): Handles mouse events.
@@ -71,6 +138,10 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     init_3D(self): Called from init_gl.
                    Configures OpenGL 3D context.
 
+    update_view(self): Called from render.
+                       Reloads the modelview matrix after a pan, zoom or
+                       rotate.
+
     render_2D(self): Called from render.
                      Handles 2D view rendering.
 
@@ -83,11 +154,33 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     on_mouse_3D(self, event): Called from on_mouse.
                               Handles mouse events in 3D view.
 
+    rotate_scene(self, angle, x, y, z): Composes a rotation into the scene
+                                        rotation matrix in place.
+
     render_text_2D(self, text, x_pos, y_pos, text_small): Called from render.
                         Handles all text writing on the canvas for the 2D view.
 
     render_text_3D(self, text, x_pos, y_pos, text_small): Called from render.
                         Handles all text writing on the canvas for the 3D view.
+
+    get_font_base(self, font): Returns the first of the display lists which
+                               draw each glyph of the font.
+
+    draw_text(self, text, font): Draws a line of text at the raster position.
+
+    get_axis_list_2D(self, signal_list_length, margin, y_pos): Returns the
+                     display list which draws the 2D cycle axis.
+
+    get_axis_list_3D(self, signal_list_length, x_pos): Returns the display
+                     list which draws the 3D cycle axis.
+
+    set_color(self, red, green, blue): Sets the GL colour if it has changed.
+
+    enable_cap(self, capability): Enables a GL capability if not enabled.
+
+    disable_cap(self, capability): Disables a GL capability if not disabled.
+
+    set_matrix_mode(self, mode): Sets the GL matrix mode if it has changed.
     """
 
     def __init__(self, parent, pos, size, devices, monitors):
@@ -98,6 +191,8 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                                      wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
         GLUT.glutInit()
         self.init = False
+        self.view_init = False  # False when pan, zoom or rotation changed
+        self.client_size = self.GetClientSize()  # kept up to date by on_size
         self.context = wxcanvas.GLContext(self)
         self.devices = devices
         self.monitors = monitors
@@ -117,6 +212,39 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.full_specular = [0.5, 0.5, 0.5, 1.0]
         self.no_specular = [0.0, 0.0, 0.0, 1.0]
 
+        # Unit cuboid spanning -1 to 1 in x and z and 0 to 1 in y, as four
+        # vertices per face, which is scaled and moved into place for each
+        # sample of a 3D trace. Faces keep their own vertices, rather than
+        # sharing 8 corners, so each face is lit with its own normal.
+        self.cuboid_vertices = np.array([
+            [-1, 0, -1], [1, 0, -1], [1, 0, 1], [-1, 0, 1],  # bottom
+            [1, 1, -1], [-1, 1, -1], [-1, 1, 1], [1, 1, 1],  # top
+            [-1, 1, -1], [-1, 0, -1], [-1, 0, 1], [-1, 1, 1],  # left
+            [1, 0, -1], [1, 1, -1], [1, 1, 1], [1, 0, 1],  # right
+            [-1, 0, -1], [-1, 1, -1], [1, 1, -1], [1, 0, -1],  # back
+            [-1, 1, 1], [-1, 0, 1], [1, 0, 1], [1, 1, 1]],  # front
+            dtype=np.float32)
+        self.cuboid_normals = np.repeat(np.array([
+            [0, -1, 0], [0, 1, 0], [-1, 0, 0], [1, 0, 0], [0, 0, -1],
+            [0, 0, 1]], dtype=np.float32), 4, axis=0)
+
+        # Lookup tables indexed by signal level: the y position of a 2D trace
+        # segment and the height of a 3D cuboid. Levels with zero height,
+        # such as BLANK, are not drawn.
+        self.signal_y = np.zeros(len(devices.signal_types), dtype=np.float32)
+        self.signal_y[devices.LOW] = 100
+        self.signal_y[devices.HIGH] = 75
+        self.signal_heights = np.zeros(len(devices.signal_types),
+                                       dtype=np.float32)
+        self.signal_heights[devices.LOW] = 1
+        self.signal_heights[devices.HIGH] = 11
+
+        # Scene rotation matrix and scratch matrices for composing rotations,
+        # allocated once and then overwritten in place
+        self.scene_rotate = np.empty((4, 4), dtype=np.float32)
+        self.rotation = np.identity(4, 'f')
+        self.rotation_product = np.empty((4, 4), dtype=np.float32)
+
         self.reset_transformation_variables()
 
         # Offset between viewpoint and origin of the scene
@@ -124,12 +252,54 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
         # Bind events to the canvas
         self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_ERASE_BACKGROUND, self.on_erase_background)
         self.Bind(wx.EVT_SIZE, self.on_size)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
 
         # control whether in 2D or 3D view
         self.choose_3D = False
 
+        # last values sent to GL, so redundant state changes can be skipped
+        self.gl_state = {}
+
+        # set once the fixed 3D lights and materials have been configured
+        self.lighting_init = False
+
+        # first of the display lists drawing each ASCII glyph, keyed by font
+        self.font_bases = {}
+
+        # monitored signal names, keyed by (device_id, output_id)
+        self.name_cache = {}
+
+        # uint8 signal arrays keyed by monitor, extended as cycles are added
+        self.signal_arrays = {}
+
+        # vertex buffer shared by all the 2D traces, the trace lengths and
+        # layout it was filled for, and the int32 first vertex and vertex
+        # count of each monitor's trace in it
+        self.trace_buffer = None
+        self.trace_key = None
+        self.trace_firsts = np.zeros(0, dtype=np.int32)
+        self.trace_counts = np.zeros(0, dtype=np.int32)
+
+        # vertex buffer holding the interleaved vertices and normals of all
+        # the 3D cuboids, the trace lengths it was filled for and its size
+        self.cuboid_buffer = None
+        self.cuboid_key = None
+        self.cuboid_vertex_count = 0
+
+        # whether vertex buffers are available, found once the context is
+        # current, and the display lists drawing the 2D traces and 3D cuboids
+        # in their place when they are not
+        self.use_buffers = None
+        self.trace_list = None
+        self.cuboid_list = None
+
+        # display list for the cycle axis of each view, and the length and
+        # layout it was last compiled for
+        self.axis_lists = {}
+        self.axis_keys = {}
+
     def reset_transformation_variables(self):
         """Set all transformation variables back to initial values."""
         # Initialise variables for panning
@@ -139,11 +309,25 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.last_mouse_y = 0  # previous mouse y position
 
         # Initialise the scene rotation matrix
-        self.scene_rotate = np.identity(4, 'f')
+        np.copyto(self.scene_rotate, np.identity(4, 'f'))
 
         # Initialise variables for zooming
         self.zoom = 1
 
+    def set_mode(self, choose_3D):
+        """Switch between the 2D and 3D view and redraw.
+
+        The GL context and the cached geometry are kept, so only the view
+        state is reset.
+        """
+        self.choose_3D = choose_3D
+        self.reset_transformation_variables()
+        if choose_3D:
+            self.pan_x = -300  # move origin to be visible on init
+            self.pan_y = 300
+        self.init = False
+        self.render()
+
     def init_gl(self):
         """Handle directing initialise command to the 2D or 3D handler."""
         if self.choose_3D is False:
@@ -153,60 +337,84 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def init_2D(self):
         """Configure and initialise the OpenGL context for a 2D render."""
-        size = self.GetClientSize()
-        self.SetCurrent(self.context)
+        size = self.client_size
         GL.glClearColor(1.0, 1.0, 1.0, 0.0)
         GL.glDrawBuffer(GL.GL_BACK)
         GL.glViewport(0, 0, size.width, size.height)
-        GL.glMatrixMode(GL.GL_PROJECTION)
+        self.set_matrix_mode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
         GL.glOrtho(0, size.width, size.height, 0, -1, 1)
-        GL.glTranslated(self.pan_x, self.pan_y, 0.0)
-        GL.glScaled(self.zoom, self.zoom, self.zoom)
+
+        # the context is shared with the 3D view, so undo its state
+        self.set_matrix_mode(GL.GL_MODELVIEW)
+        self.disable_cap(GL.GL_COLOR_MATERIAL)
+        self.disable_cap(GL.GL_CULL_FACE)
+        self.disable_cap(GL.GL_DEPTH_TEST)
+        self.disable_cap(GL.GL_LIGHTING)
+        self.disable_cap(GL.GL_LIGHT0)
+        self.disable_cap(GL.GL_LIGHT1)
+        self.disable_cap(GL.GL_NORMALIZE)
 
     def init_3D(self):
         """Configure and initialise the OpenGL context for a 3D render."""
-        size = self.GetClientSize()
-        self.SetCurrent(self.context)
+        size = self.client_size
 
         GL.glViewport(0, 0, size.width, size.height)
 
-        GL.glMatrixMode(GL.GL_PROJECTION)
+        self.set_matrix_mode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
         GLU.gluPerspective(45, size.width / size.height, 10, 10000)
 
-        GL.glMatrixMode(GL.GL_MODELVIEW)
+        self.set_matrix_mode(GL.GL_MODELVIEW)
         GL.glLoadIdentity()  # lights positioned relative to the viewer
 
-        # set the parameters for 2 light sources in the 3D view.
-        GL.glLightfv(GL.GL_LIGHT0, GL.GL_AMBIENT, self.no_ambient)
-        GL.glLightfv(GL.GL_LIGHT0, GL.GL_DIFFUSE, self.med_diffuse)
-        GL.glLightfv(GL.GL_LIGHT0, GL.GL_SPECULAR, self.no_specular)
-        GL.glLightfv(GL.GL_LIGHT0, GL.GL_POSITION, self.top_right)
-        GL.glLightfv(GL.GL_LIGHT1, GL.GL_AMBIENT, self.no_ambient)
-        GL.glLightfv(GL.GL_LIGHT1, GL.GL_DIFFUSE, self.dim_diffuse)
-        GL.glLightfv(GL.GL_LIGHT1, GL.GL_SPECULAR, self.no_specular)
-        GL.glLightfv(GL.GL_LIGHT1, GL.GL_POSITION, self.straight_on)
-
-        # set the material properties of the rendered items
-        GL.glMaterialfv(GL.GL_FRONT, GL.GL_SPECULAR, self.mat_specular)
-        GL.glMaterialfv(GL.GL_FRONT, GL.GL_SHININESS, self.mat_shininess)
-        GL.glMaterialfv(GL.GL_FRONT, GL.GL_AMBIENT_AND_DIFFUSE,
-                        self.mat_diffuse)
-        GL.glColorMaterial(GL.GL_FRONT, GL.GL_AMBIENT_AND_DIFFUSE)
+        # lights and materials never change, so they are only set up once
+        # per context rather than on every pan, zoom and rotate.
+        if not self.lighting_init:
+            # set the parameters for 2 light sources in the 3D view.
+            GL.glLightfv(GL.GL_LIGHT0, GL.GL_AMBIENT, self.no_ambient)
+            GL.glLightfv(GL.GL_LIGHT0, GL.GL_DIFFUSE, self.med_diffuse)
+            GL.glLightfv(GL.GL_LIGHT0, GL.GL_SPECULAR, self.no_specular)
+            GL.glLightfv(GL.GL_LIGHT0, GL.GL_POSITION, self.top_right)
+            GL.glLightfv(GL.GL_LIGHT1, GL.GL_AMBIENT, self.no_ambient)
+            GL.glLightfv(GL.GL_LIGHT1, GL.GL_DIFFUSE, self.dim_diffuse)
+            GL.glLightfv(GL.GL_LIGHT1, GL.GL_SPECULAR, self.no_specular)
+            GL.glLightfv(GL.GL_LIGHT1, GL.GL_POSITION, self.straight_on)
+
+            # set the material properties of the rendered items
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_SPECULAR, self.mat_specular)
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_SHININESS, self.mat_shininess)
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_AMBIENT_AND_DIFFUSE,
+                            self.mat_diffuse)
+            GL.glColorMaterial(GL.GL_FRONT, GL.GL_AMBIENT_AND_DIFFUSE)
+
+            GL.glDepthFunc(GL.GL_LEQUAL)
+            GL.glShadeModel(GL.GL_SMOOTH)
+            GL.glCullFace(GL.GL_BACK)
+            self.lighting_init = True
 
         GL.glClearColor(0.0, 0.0, 0.0, 0.0)
-        GL.glDepthFunc(GL.GL_LEQUAL)
-        GL.glShadeModel(GL.GL_SMOOTH)
         GL.glDrawBuffer(GL.GL_BACK)
-        GL.glCullFace(GL.GL_BACK)
-        GL.glEnable(GL.GL_COLOR_MATERIAL)
-        GL.glEnable(GL.GL_CULL_FACE)
-        GL.glEnable(GL.GL_DEPTH_TEST)
-        GL.glEnable(GL.GL_LIGHTING)
-        GL.glEnable(GL.GL_LIGHT0)
-        GL.glEnable(GL.GL_LIGHT1)
-        GL.glEnable(GL.GL_NORMALIZE)
+        self.enable_cap(GL.GL_COLOR_MATERIAL)
+        self.enable_cap(GL.GL_CULL_FACE)
+        self.enable_cap(GL.GL_DEPTH_TEST)
+        self.enable_cap(GL.GL_LIGHTING)
+        self.enable_cap(GL.GL_LIGHT0)
+        self.enable_cap(GL.GL_LIGHT1)
+        self.enable_cap(GL.GL_NORMALIZE)
+
+    def update_view(self):
+        """Reload the modelview matrix from the pan, zoom and rotation.
+
+        Only the modelview matrix depends on these, so mouse events do not
+        need the viewport, projection and capabilities set up again.
+        """
+        self.set_matrix_mode(GL.GL_MODELVIEW)
+        GL.glLoadIdentity()
+        if self.choose_3D is False:
+            GL.glTranslated(self.pan_x, self.pan_y, 0.0)
+            GL.glScaled(self.zoom, self.zoom, self.zoom)
+            return
 
         # Viewing transformation - set the viewpoint back from the scene
         GL.glTranslatef(0, 0, -self.depth_offset)
@@ -219,11 +427,22 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def render(self):
         """Handle directing render command to the 2D or 3D handler."""
+        if not self.IsShownOnScreen():
+            # nothing can be seen; showing the window sends a paint event
+            return
+
         self.SetCurrent(self.context)
         if not self.init:
             # Configure the viewport, modelview and projection matrices
             self.init_gl()
             self.init = True
+            self.view_init = False
+            if self.use_buffers is None:
+                # vertex buffers need OpenGL 1.5
+                self.use_buffers = bool(GL.glGenBuffers)
+        if not self.view_init:
+            self.update_view()
+            self.view_init = True
 
         if self.choose_3D is False:
             self.render_2D()
@@ -237,176 +456,376 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
         # get list of signals for a single monitor
 
-        device_number = 0
         signal_list_length = 0
+        margin = self.monitors.get_margin()
 
-        for device_id, output_id in self.monitors.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            signal_list = self.monitors.monitors_dictionary[(device_id, output_id)]
+        for device_number, ((device_id, output_id), signal_list) in enumerate(
+                self.monitors.monitors_dictionary.items()):
+            monitor_name = self.get_signal_name(device_id, output_id)
 
             x = 10
             y = 85 + device_number*50
 
             self.render_text_2D(monitor_name, x, y, False)
-            margin = self.monitors.get_margin()
-
-            GL.glColor3f(0.0, 0.0, 1.0)  # signal trace is blue
-            GL.glBegin(GL.GL_LINE_STRIP)
+            signal_list_length = len(signal_list)
 
-            # draw signal according to list of states
+        # draw the signals according to their lists of states from a single
+        # buffer, as one line strip per monitor in a single call
+
+        if self.monitors.monitors_dictionary:
+            self.set_color(0.0, 0.0, 1.0)  # signal trace is blue
+            if self.use_buffers:
+                GL.glBindBuffer(GL.GL_ARRAY_BUFFER,
+                                self.get_trace_buffer(margin))
+                GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+                GL.glVertexPointer(2, GL.GL_FLOAT, 0, None)
+                GL.glMultiDrawArrays(GL.GL_LINE_STRIP, self.trace_firsts,
+                                     self.trace_counts, len(self.trace_counts))
+                GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+                GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+            else:
+                GL.glCallList(self.get_trace_list(margin))
 
-            signal_list_length = len(signal_list)
+            # draw x axis below the last monitor
+            y = 85 + len(self.monitors.monitors_dictionary)*50
+            self.set_color(0.0, 0.0, 0.0)  # text is black
+            GL.glCallList(self.get_axis_list_2D(signal_list_length, margin,
+                                                y))
 
-            for i in range(signal_list_length):
-                x = (i * 20) + 40 + margin*10
-                x_next = (i * 20) + 60 + margin*10
-                if signal_list[i] == self.devices.LOW:
-                    y = 100 + device_number*50
-                elif signal_list[i] == self.devices.HIGH:
-                    y = 75 + device_number*50
-                elif signal_list[i] == self.devices.BLANK:
-                    y = 0
-
-                # keep waveforms for monitor points added after
-                # first cycles blank until point of addition
-
-                if y != 0:
-                    GL.glVertex2f(x, y)
-                    GL.glVertex2f(x_next, y)
-            GL.glEnd()
-
-            device_number += 1
-
-        # draw x axis
-        y = 85 + (device_number)*50
-        for i in range(signal_list_length):
-            x = (i * 20) + 40 + margin*10
-            self.render_text_2D('|', x, y, True)
-            if i % 5 == 0:
-                self.render_text_2D(str(i), x-2, y+20, True)
-
-        # We have been drawing to the back buffer, flush the graphics pipeline
-        # and swap the back buffer to the front
-        GL.glFlush()
+        # We have been drawing to the back buffer, so swap it to the front.
+        # SwapBuffers flushes the pipeline itself.
         self.SwapBuffers()
 
+    def get_trace_vertices(self, signals, margin):
+        """Return the 2D trace vertices of every monitor and their counts.
+
+        signals is the uint8 signal matrix with one row per monitor. The
+        vertices of all the traces are returned together as one float32 array,
+        in monitor order, along with the number of vertices in each trace.
+
+        Each run of consecutive samples at the same level contributes the two
+        ends of one horizontal segment, and the line strip joins the runs with
+        vertical edges. BLANK samples are dropped so that waveforms for monitor
+        points added after the first cycles stay blank until the point of
+        addition.
+        """
+        # monitor rows and sample indices to draw, in row-major order
+        rows, drawn = np.nonzero(self.signal_heights[signals])
+        y = self.signal_y[signals[rows, drawn]] + rows*50
+
+        # a run starts wherever the monitor or level changes or samples were
+        # skipped
+        run_start = np.ones(len(drawn), dtype=bool)
+        run_start[1:] = ((rows[1:] != rows[:-1]) | (y[1:] != y[:-1])
+                         | (np.diff(drawn) != 1))
+        starts = np.flatnonzero(run_start)
+        ends = np.empty_like(starts)  # the sample before the next run
+        ends[:-1] = starts[1:] - 1
+        ends[-1:] = len(drawn) - 1
+
+        vertices = np.empty((2 * len(starts), 2), dtype=np.float32)
+        x_start = 40 + margin*10  # left edge of the first sample
+        vertices[0::2, 0] = drawn[starts] * 20 + x_start
+        vertices[1::2, 0] = drawn[ends] * 20 + (x_start + 20)
+        vertices[0::2, 1] = y[starts]
+        vertices[1::2, 1] = y[starts]
+        vertex_counts = 2 * np.bincount(rows[starts], minlength=len(signals))
+        return vertices, vertex_counts
+
+    def get_trace_buffer(self, margin):
+        """Return the vertex buffer holding every monitor's 2D trace.
+
+        All the traces are uploaded together once per simulation update and
+        layout, so that repaints for panning and zooming draw straight from
+        GPU memory. The buffer is reused for each upload, and trace_firsts
+        and trace_counts give the first vertex and vertex count of each
+        monitor's trace.
+        """
+        key = (tuple(map(len, self.monitors.monitors_dictionary.values())),
+               margin)
+        if key != self.trace_key:
+            vertices, vertex_counts = self.get_trace_vertices(
+                self.get_signal_matrix(), margin)
+            vertex_counts = vertex_counts.astype(np.int32)
+
+            if self.trace_buffer is None:
+                self.trace_buffer = GL.glGenBuffers(1)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.trace_buffer)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                            GL.GL_STATIC_DRAW)
+            self.trace_firsts = np.cumsum(vertex_counts,
+                                          dtype=np.int32) - vertex_counts
+            self.trace_counts = vertex_counts
+            self.trace_key = key
+        return self.trace_buffer
+
+    def get_trace_list(self, margin):
+        """Return a display list which draws every monitor's 2D trace.
+
+        This takes the place of the vertex buffer where buffers are not
+        available. The vertex array is copied into the list when it is
+        compiled, once per simulation update and layout.
+        """
+        key = (tuple(map(len, self.monitors.monitors_dictionary.values())),
+               margin)
+        if key != self.trace_key:
+            vertices, vertex_counts = self.get_trace_vertices(
+                self.get_signal_matrix(), margin)
+            firsts = np.cumsum(vertex_counts) - vertex_counts
+
+            if self.trace_list is None:
+                self.trace_list = GL.glGenLists(1)
+            # client state is not compiled, but is read while compiling
+            GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glVertexPointer(2, GL.GL_FLOAT, 0, vertices)
+            GL.glNewList(self.trace_list, GL.GL_COMPILE)
+            for first, vertex_count in zip(firsts.tolist(),
+                                           vertex_counts.tolist()):
+                GL.glDrawArrays(GL.GL_LINE_STRIP, first, vertex_count)
+            GL.glEndList()
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+            self.trace_key = key
+        return self.trace_list
+
+    def get_signal_name(self, device_id, output_id):
+        """Return the name of the monitored signal, caching it per monitor."""
+        key = (device_id, output_id)
+        if key not in self.name_cache:
+            self.name_cache[key] = self.devices.get_signal_name(device_id,
+                                                                output_id)
+        return self.name_cache[key]
+
+    def clear_name_cache(self):
+        """Discard the cached signal names after the monitors change."""
+        self.name_cache = {}
+
+    def get_signal_array(self, device_id, output_id, signal_list):
+        """Return a monitor's signal list encoded as a uint8 NumPy array.
+
+        The array is shared by the 2D and 3D views. Signal lists only grow
+        while a simulation is continued, so only the new cycles are encoded
+        and appended to the cached array.
+        """
+        key = (device_id, output_id)
+        signals = self.signal_arrays.get(key)
+        if signals is None or len(signals) > len(signal_list):
+            signals = np.asarray(signal_list, dtype=np.uint8)
+        elif len(signals) < len(signal_list):
+            new_signals = np.asarray(signal_list[len(signals):],
+                                     dtype=np.uint8)
+            signals = np.concatenate((signals, new_signals))
+        self.signal_arrays[key] = signals
+        return signals
+
+    def get_signal_matrix(self):
+        """Return the signal lists of all monitors as a uint8 matrix.
+
+        Each row is a monitor's cached signal array, in monitor order, so the
+        geometry of every trace can be built in one pass. Rows shorter than
+        the longest signal list are padded with BLANK, which is not drawn.
+        """
+        signal_arrays = [
+            self.get_signal_array(device_id, output_id, signal_list)
+            for (device_id, output_id), signal_list
+            in self.monitors.monitors_dictionary.items()]
+        length = max(map(len, signal_arrays), default=0)
+        signals = np.full((len(signal_arrays), length), self.devices.BLANK,
+                          dtype=np.uint8)
+        for row, signal_array in zip(signals, signal_arrays):
+            row[:len(signal_array)] = signal_array
+        return signals
+
+    def clear_signal_arrays(self):
+        """Discard the cached signal arrays after the signal lists restart."""
+        self.signal_arrays = {}
+
+    def clear_trace_cache(self):
+        """Discard the cached trace geometry after the signals restart.
+
+        Geometry is keyed by the trace lengths, so it is rebuilt anyway when
+        a simulation is continued.
+        """
+        self.trace_key = None
+        self.cuboid_key = None
+
     def render_3D(self):
         """Handle all drawing operations for a 3D render."""
         # Clear everything
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
 
-        # configure range in x to keep origin in the center of the signals
+        # x position of each device, keeping the origin in the center of the
+        # signals, and the matching vertical position for the cycle axis
 
         num_devices = len(self.monitors.monitors_dictionary)
-        start_index_devices = -(num_devices//2)
-        if num_devices % 2 == 0:
-            end_index_devices = -start_index_devices
-        else:
-            end_index_devices = -start_index_devices + 1
-        device_range = range(start_index_devices, end_index_devices)
+        x_positions = ((np.arange(num_devices) - num_devices//2) * 20).tolist()
+        axis_x = -(num_devices//2 + 1) * 20
 
-        # for each device, plot its name and waveform.
+        # for each device, plot its waveform and store its label.
 
-        device_number = 0
+        signal_list_length = 0
         margin = self.monitors.get_margin()
+        labels = []  # (monitor_name, x, z) drawn after all the cuboids
 
-        for device_id, output_id in self.monitors.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            signal_list = self.monitors.monitors_dictionary[(device_id, output_id)]
+        for device_number, ((device_id, output_id), signal_list) in enumerate(
+                self.monitors.monitors_dictionary.items()):
+            monitor_name = self.get_signal_name(device_id, output_id)
             signal_list_length = len(signal_list)
 
-            # configure range in z to keep origin in the center of the signals
-
-            start_index_signal = -(signal_list_length//2)
-            if signal_list_length % 2 == 0:
-                end_index_signal = -start_index_signal
+            # z of the first sample keeps the origin in the center of the signals
+            start_z = -(signal_list_length//2) * 20
+
+            x = x_positions[device_number]
+            labels.append((monitor_name, x, start_z - 20 - margin*10))
+
+        # draw the signals according to their lists of states, with every
+        # cuboid in a single call since the quads are independent
+
+        if self.monitors.monitors_dictionary:
+            self.set_color(0.7, 0.2, 1)  # signal trace is purple
+            if self.use_buffers:
+                GL.glBindBuffer(GL.GL_ARRAY_BUFFER,
+                                self.get_cuboid_buffer(x_positions))
+                GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+                GL.glEnableClientState(GL.GL_NORMAL_ARRAY)
+                # each vertex is 3 floats of position followed by 3 of normal
+                GL.glVertexPointer(3, GL.GL_FLOAT, 24, None)
+                GL.glNormalPointer(GL.GL_FLOAT, 24, ctypes.c_void_p(12))
+                GL.glDrawArrays(GL.GL_QUADS, 0, self.cuboid_vertex_count)
+                GL.glDisableClientState(GL.GL_NORMAL_ARRAY)
+                GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+                GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
             else:
-                end_index_signal = -start_index_signal + 1
-            signal_range = range(start_index_signal, end_index_signal)
+                GL.glCallList(self.get_cuboid_list(x_positions))
 
-            # draw signal according to list of states
+        # draw all text unlit, toggling lighting once per frame
 
-            x = device_range[device_number] * 20
-            self.render_text_3D(monitor_name, x, 0, start_index_signal * 20 - 20 - margin*10)
-
-            GL.glColor3f(0.7, 0.2, 1)  # signal trace is purple
-            for i in range(signal_list_length):
-                z = signal_range[i] * 20
-                if signal_list[i] == self.devices.LOW:
-                    self.draw_cuboid(x, z, 5, 10, 1)
-                elif signal_list[i] == self.devices.HIGH:
-                    self.draw_cuboid(x, z, 5, 10, 11)
-
-            device_number += 1
+        self.disable_cap(GL.GL_LIGHTING)
+        for monitor_name, x, z in labels:
+            self.render_text_3D(monitor_name, x, 0, z)
 
         # draw axis for number of cycles.
 
-        for i in range(signal_list_length):
-            z = signal_range[i] * 20
-            self.render_text_3D(str(i), (device_range[0]-1)*20, 0, z - 10)
+        self.set_color(1, 1, 1)  # text in white
+        GL.glCallList(self.get_axis_list_3D(signal_list_length, axis_x))
+        self.enable_cap(GL.GL_LIGHTING)
 
-        # We have been drawing to the back buffer, flush the graphics pipeline
-        # and swap the back buffer to the front
-        GL.glFlush()
+        # We have been drawing to the back buffer, so swap it to the front.
+        # SwapBuffers flushes the pipeline itself.
         self.SwapBuffers()
 
-    def draw_cuboid(self, x_pos, z_pos, half_width, half_depth, height):
-        """Draw a cuboid.
+    def get_cuboid_geometry(self, signals):
+        """Return the monitor rows, z positions and heights of the 3D cuboids.
 
-        Draw a cuboid at the specified position, with the specified
-        dimensions.
+        signals is the uint8 signal matrix with one row per monitor. LOW
+        samples are drawn as flat cuboids and HIGH samples as tall ones. Any
+        other samples, such as BLANK, are not drawn.
+        """
+        heights = self.signal_heights[signals]
+        rows, drawn = np.nonzero(heights)  # monitor rows and sample indices
+        z_positions = (drawn - signals.shape[1]//2) * 20
+        return rows, z_positions, heights[rows, drawn]
+
+    def get_cuboid_mesh(self, signals, x_positions):
+        """Return the merged cuboid mesh of every monitor's 3D trace.
+
+        signals is the uint8 signal matrix and x_positions gives the x
+        position of each monitor's trace. Every cuboid is baked into one
+        float32 array of interleaved vertices and normals, with its position
+        and height already applied to the unit cuboid.
         """
-        GL.glBegin(GL.GL_QUADS)
-        GL.glNormal3f(0, -1, 0)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glNormal3f(0, 1, 0)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glNormal3f(-1, 0, 0)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glNormal3f(1, 0, 0)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glNormal3f(0, 0, -1)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glNormal3f(0, 0, 1)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glEnd()
+        rows, z_positions, heights = self.get_cuboid_geometry(signals)
+        num_cuboids = len(heights)
+
+        # scale the unit cuboid by (half width, height, half depth)
+        scale = np.empty((num_cuboids, 1, 3), dtype=np.float32)
+        scale[:, 0, 0] = 5
+        scale[:, 0, 1] = heights
+        scale[:, 0, 2] = 10
+        offset = np.empty((num_cuboids, 1, 3), dtype=np.float32)
+        offset[:, 0, 0] = np.asarray(x_positions)[rows]
+        offset[:, 0, 1] = -6
+        offset[:, 0, 2] = z_positions
+
+        mesh = np.empty((num_cuboids, len(self.cuboid_vertices), 6),
+                        dtype=np.float32)
+        mesh[:, :, :3] = self.cuboid_vertices * scale + offset
+        mesh[:, :, 3:] = self.cuboid_normals
+        return mesh.reshape(-1, 6)
+
+    def get_cuboid_buffer(self, x_positions):
+        """Return the vertex buffer holding every monitor's 3D cuboids.
+
+        x_positions gives the x position of each monitor's trace. The meshes
+        are uploaded together once per simulation update, so that repaints
+        for panning, zooming and rotating draw straight from GPU memory.
+        """
+        key = tuple(map(len, self.monitors.monitors_dictionary.values()))
+        if key != self.cuboid_key:
+            mesh = self.get_cuboid_mesh(self.get_signal_matrix(), x_positions)
+
+            if self.cuboid_buffer is None:
+                self.cuboid_buffer = GL.glGenBuffers(1)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.cuboid_buffer)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, mesh.nbytes, mesh,
+                            GL.GL_STATIC_DRAW)
+            self.cuboid_vertex_count = len(mesh)
+            self.cuboid_key = key
+        return self.cuboid_buffer
+
+    def get_cuboid_list(self, x_positions):
+        """Return a display list which draws every monitor's 3D cuboids.
+
+        This takes the place of the vertex buffer where buffers are not
+        available, and is compiled once per simulation update.
+        """
+        key = tuple(map(len, self.monitors.monitors_dictionary.values()))
+        if key != self.cuboid_key:
+            mesh = self.get_cuboid_mesh(self.get_signal_matrix(), x_positions)
+            vertices = np.ascontiguousarray(mesh[:, :3])
+            normals = np.ascontiguousarray(mesh[:, 3:])
+
+            if self.cuboid_list is None:
+                self.cuboid_list = GL.glGenLists(1)
+            # client state is not compiled, but is read while compiling
+            GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glEnableClientState(GL.GL_NORMAL_ARRAY)
+            GL.glVertexPointer(3, GL.GL_FLOAT, 0, vertices)
+            GL.glNormalPointer(GL.GL_FLOAT, 0, normals)
+            GL.glNewList(self.cuboid_list, GL.GL_COMPILE)
+            GL.glDrawArrays(GL.GL_QUADS, 0, len(mesh))
+            GL.glEndList()
+            GL.glDisableClientState(GL.GL_NORMAL_ARRAY)
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+            self.cuboid_key = key
+        return self.cuboid_list
 
     def on_paint(self, event):
-        """Handle the paint event."""
-        self.SetCurrent(self.context)
-        if not self.init:
-            # Configure the viewport, modelview and projection matrices
-            self.init_gl()
-            self.init = True
+        """Handle the paint event.
+
+        The back buffer is undefined after a swap, so the scene is redrawn on
+        every paint event, including exposes. Only the drawing is repeated, as
+        the trace geometry stays cached until the signals change.
+        """
+        wx.PaintDC(self)  # validates the damaged region, as wx requires
 
-        size = self.GetClientSize()
-        text = "".join(["Canvas redrawn on paint event, size is ",
-                        str(size.width), ", ", str(size.height)])
         self.render()
 
+    def on_erase_background(self, event):
+        """Handle the erase background event.
+
+        The event is not skipped, so the background is never erased. Every
+        paint redraws the whole canvas, and erasing first would only make it
+        flicker.
+        """
+
     def on_size(self, event):
         """Handle the canvas resize event."""
-        # Forces reconfiguration of the viewport, modelview and projection
-        # matrices on the next paint event
-        self.init = False
+        size = self.GetClientSize()
+        if size != self.client_size:
+            # Forces reconfiguration of the viewport, modelview and
+            # projection matrices on the next paint event
+            self.client_size = size
+            self.init = False
 
     def on_mouse(self, event):
         """Handle directing mouse events to the 2D or 3D handler."""
@@ -417,112 +836,216 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     def on_mouse_2D(self, event):
         """Handle mouse events for a 2D render."""
-        text = ""
+        redraw = False  # set when the pan or zoom changes
         if event.ButtonDown():
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = -event.GetY()
 
-        if event.ButtonUp():
-            text = "".join(["Mouse button released at: ", str(event.GetX()),
-                            ", ", str(event.GetY())])
-        if event.Leaving():
-            text = "".join(["Mouse left canvas at: ", str(event.GetX()),
-                            ", ", str(event.GetY())])
         if event.Dragging():
             self.pan_x += event.GetX() - self.last_mouse_x
             self.pan_y -= -event.GetY() - self.last_mouse_y
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = -event.GetY()
-            self.init = False
-            text = "".join(["Mouse dragged to: ", str(event.GetX()),
-                            ", ", str(event.GetY()), ". Pan is now: ",
-                            str(self.pan_x), ", ", str(self.pan_y)])
-        if event.GetWheelRotation() < 0:
+            self.view_init = False
+            redraw = True
+        wheel_rotation = event.GetWheelRotation()
+        if wheel_rotation < 0 and self.zoom > 0.65:
             self.zoom *= (1.0 + (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
+                wheel_rotation / (20 * event.GetWheelDelta())))
             if self.zoom < 0.65:
                 self.zoom = 0.65  # stop user zooming out so signals don't overlap.
-            self.init = False
-            text = "".join(["Negative mouse wheel rotation. Zoom is now: ",
-                            str(self.zoom)])
-        if event.GetWheelRotation() > 0:
+            self.view_init = False
+            redraw = True
+        if wheel_rotation > 0:
             self.zoom /= (1.0 - (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            self.init = False
-            text = "".join(["Positive mouse wheel rotation. Zoom is now: ",
-                            str(self.zoom)])
-        if text:
-            self.render()
-        else:
-            self.Refresh()  # triggers the paint event
+                wheel_rotation / (20 * event.GetWheelDelta())))
+            self.view_init = False
+            redraw = True
+        # Refresh only invalidates the canvas, so a burst of wheel events
+        # is coalesced into a single paint
+        if redraw:
+            self.Refresh(eraseBackground=False)  # triggers the paint event
 
     def on_mouse_3D(self, event):
         """Handle mouse events for a 3D render."""
+        redraw = False  # set when the pan, rotation or zoom changes
         if event.ButtonDown():
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
 
         if event.Dragging():
-            GL.glMatrixMode(GL.GL_MODELVIEW)
-            GL.glLoadIdentity()
             x = event.GetX() - self.last_mouse_x
             y = event.GetY() - self.last_mouse_y
-            if event.LeftIsDown():
-                GL.glRotatef(math.sqrt((x * x) + (y * y)), y, x, 0)
+            # compose rotations in NumPy rather than reading back from GL
             if event.MiddleIsDown():
-                GL.glRotatef((x + y), 0, 0, 1)
+                self.rotate_scene(x + y, 0, 0, 1)
+            if event.LeftIsDown():
+                self.rotate_scene(math.hypot(x, y), y, x, 0)
             if event.RightIsDown():
                 self.pan_x += x
                 self.pan_y -= y
-            GL.glMultMatrixf(self.scene_rotate)
-            GL.glGetFloatv(GL.GL_MODELVIEW_MATRIX, self.scene_rotate)
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
-            self.init = False
+            self.view_init = False
+            redraw = True
 
-        if event.GetWheelRotation() < 0:
+        wheel_rotation = event.GetWheelRotation()
+        if wheel_rotation < 0:
             self.zoom *= (1.0 + (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            self.init = False
+                wheel_rotation / (20 * event.GetWheelDelta())))
+            self.view_init = False
+            redraw = True
 
-        if event.GetWheelRotation() > 0:
+        if wheel_rotation > 0:
             self.zoom /= (1.0 - (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            self.init = False
+                wheel_rotation / (20 * event.GetWheelDelta())))
+            self.view_init = False
+            redraw = True
+
+        if redraw:
+            self.Refresh(eraseBackground=False)  # triggers the paint event
+
+    def rotate_scene(self, angle, x, y, z):
+        """Rotate the scene as glRotatef(angle, x, y, z) would, in place.
 
-        self.Refresh()  # triggers the paint event
+        The rotation is composed with scene_rotate, which is kept in OpenGL's
+        column-major order so it can be passed straight to glMultMatrixf.
+        Preallocated buffers are reused so dragging allocates no matrices.
+        """
+        length = math.sqrt(x*x + y*y + z*z)
+        if angle == 0 or length == 0:
+            return
+
+        x, y, z = x / length, y / length, z / length
+        c = math.cos(math.radians(angle))
+        s = math.sin(math.radians(angle))
+        # rows of the transposed rotation matrix, i.e. columns of the
+        # mathematical one. The last row and column stay as the identity.
+        self.rotation[:3, :3] = [
+            [x*x*(1-c) + c, y*x*(1-c) + z*s, x*z*(1-c) - y*s],
+            [x*y*(1-c) - z*s, y*y*(1-c) + c, y*z*(1-c) + x*s],
+            [x*z*(1-c) + y*s, y*z*(1-c) - x*s, z*z*(1-c) + c]]
+        np.matmul(self.scene_rotate, self.rotation, out=self.rotation_product)
+        self.scene_rotate[...] = self.rotation_product
 
     def render_text_2D(self, text, x_pos, y_pos, text_small):
         """Handle text drawing operations for a 2D render."""
-        GL.glColor3f(0.0, 0.0, 0.0)  # text is black
-        GL.glRasterPos2f(x_pos, y_pos)
+        self.set_color(0.0, 0.0, 0.0)  # text is black
         if text_small is True:
             font = GLUT.GLUT_BITMAP_HELVETICA_12
         else:
             font = GLUT.GLUT_BITMAP_HELVETICA_18
 
-        for character in text:
-            if character == '\n':
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+        for line in text.split('\n'):
+            GL.glRasterPos2f(x_pos, y_pos)
+            self.draw_text(line, font)
+            y_pos = y_pos - 20
 
     def render_text_3D(self, text, x_pos, y_pos, z_pos):
-        """Handle text drawing operations for a 3D render."""
-        GL.glColor3f(1, 1, 1)  # text in white
-        GL.glDisable(GL.GL_LIGHTING)
-        GL.glRasterPos3f(x_pos, y_pos, z_pos)
+        """Handle text drawing operations for a 3D render.
+
+        Lighting must already be disabled by the caller, so that a whole batch
+        of labels can be drawn with a single lighting toggle.
+        """
+        self.set_color(1, 1, 1)  # text in white
         font = GLUT.GLUT_BITMAP_HELVETICA_18
 
-        for character in text:
-            if character == '\n':
-                y_pos = y_pos - 20
-                GL.glRasterPos3f(x_pos, y_pos, z_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+        for line in text.split('\n'):
+            GL.glRasterPos3f(x_pos, y_pos, z_pos)
+            self.draw_text(line, font)
+            y_pos = y_pos - 20
 
-        GL.glEnable(GL.GL_LIGHTING)
+    def get_font_base(self, font):
+        """Return the first of the display lists which draw each ASCII glyph.
+
+        The glyph lists are compiled the first time the font is used, so that
+        any later line of text is drawn with a single glCallLists.
+        """
+        if font not in self.font_bases:
+            font_base = GL.glGenLists(128)
+            for character in range(128):
+                GL.glNewList(font_base + character, GL.GL_COMPILE)
+                GLUT.glutBitmapCharacter(font, character)
+                GL.glEndList()
+            self.font_bases[font] = font_base
+        return self.font_bases[font]
+
+    def draw_text(self, text, font):
+        """Draw a line of text in the font at the current raster position."""
+        GL.glListBase(self.get_font_base(font))
+        GL.glCallLists(text.encode("ascii", "replace"))
+
+    def get_axis_list_2D(self, signal_list_length, margin, y_pos):
+        """Return a display list which draws the 2D cycle axis.
+
+        The tick marks and cycle numbers are compiled together, so the whole
+        axis is drawn with one call until the trace length or layout changes.
+        The axis does not depend on the signal values, so it is kept when the
+        simulation is rerun for the same number of cycles.
+        """
+        key = (signal_list_length, margin, y_pos)
+        if self.axis_keys.get("2D") != key:
+            font = GLUT.GLUT_BITMAP_HELVETICA_12
+            self.get_font_base(font)  # compile glyphs before the axis list
+
+            x_start = 40 + margin*10  # left edge of the first sample
+            if "2D" not in self.axis_lists:
+                self.axis_lists["2D"] = GL.glGenLists(1)
+            # compiling into the same list replaces its old contents
+            GL.glNewList(self.axis_lists["2D"], GL.GL_COMPILE)
+            for i in range(signal_list_length):
+                x = (i * 20) + x_start
+                GL.glRasterPos2f(x, y_pos)
+                self.draw_text('|', font)
+                if i % 5 == 0:
+                    GL.glRasterPos2f(x-2, y_pos+20)
+                    self.draw_text(str(i), font)
+            GL.glEndList()
+            self.axis_keys["2D"] = key
+        return self.axis_lists["2D"]
+
+    def get_axis_list_3D(self, signal_list_length, x_pos):
+        """Return a display list which draws the 3D cycle axis numbers."""
+        key = (signal_list_length, x_pos)
+        if self.axis_keys.get("3D") != key:
+            font = GLUT.GLUT_BITMAP_HELVETICA_18
+            self.get_font_base(font)  # compile glyphs before the axis list
+
+            start_z = -(signal_list_length//2) * 20
+            if "3D" not in self.axis_lists:
+                self.axis_lists["3D"] = GL.glGenLists(1)
+            GL.glNewList(self.axis_lists["3D"], GL.GL_COMPILE)
+            for i in range(signal_list_length):
+                GL.glRasterPos3f(x_pos, 0, start_z + i*20 - 10)
+                self.draw_text(str(i), font)
+            GL.glEndList()
+            self.axis_keys["3D"] = key
+        return self.axis_lists["3D"]
+
+    def set_color(self, red, green, blue):
+        """Set the current colour, skipping the GL call if unchanged."""
+        color = (red, green, blue)
+        if self.gl_state.get("color") != color:
+            GL.glColor3f(red, green, blue)
+            self.gl_state["color"] = color
+
+    def enable_cap(self, capability):
+        """Enable a GL capability, skipping the GL call if already enabled."""
+        if self.gl_state.get(capability) is not True:
+            GL.glEnable(capability)
+            self.gl_state[capability] = True
+
+    def disable_cap(self, capability):
+        """Disable a GL capability, skipping the GL call if already disabled."""
+        if self.gl_state.get(capability) is not False:
+            GL.glDisable(capability)
+            self.gl_state[capability] = False
+
+    def set_matrix_mode(self, mode):
+        """Set the matrix mode, skipping the GL call if unchanged."""
+        if self.gl_state.get("matrix_mode") != mode:
+            GL.glMatrixMode(mode)
+            self.gl_state["matrix_mode"] = mode
 
 
 class Gui(wx.Frame):
@@ -568,6 +1091,8 @@ class Gui(wx.Frame):
     write_to_dialogue(self, text): Prints text in the dialogue box with a line
                                    between each call.
 
+    flush_dialogue(self): Writes queued text to the dialogue box.
+
     run_network(self, cycles): Runs the network for the specified number of
                                simulation cycles.
 
@@ -576,11 +1101,17 @@ class Gui(wx.Frame):
     configure_view(self): Initialises all widgets into appropriate places
                           on the GUI.
 
-    reset_monitor_lists(self): Called from zap and add button event handlers.
-                               Used to reset the lists for the drop-down menus.
+    refresh_monitors(self): Called from zap and add button event handlers.
+                            Redraws the canvas and resets the monitor lists.
+
+    reset_monitor_lists(self): Called from refresh_monitors. Used to reset the
+                               lists for the drop-down menus.
 
     define_long_texts(self): Defines long text inputs for use in the GUI.
 
+    define_messages(self): Translates the dialogue box messages and dialog
+                           titles once.
+
     """
 
     def __init__(self, title, path, names, devices, network, monitors):
@@ -591,6 +1122,7 @@ class Gui(wx.Frame):
         self.monitors = monitors
         self.network = network
         self.define_long_texts()
+        self.define_messages()
 
         # define variables used similarly to userint class
 
@@ -599,6 +1131,12 @@ class Gui(wx.Frame):
         self.line = ""  # current string entered by the user
         self.cursor = 0  # cursor position
 
+        # dialogue box text queued until the next flush
+        self.dialogue_buffer = []
+
+        # [device_id, port_id] for each monitor name already resolved
+        self.monitor_IDs = {}
+
         # Configure the menu bar
         fileMenu = wx.Menu()
         helpMenu = wx.Menu()
@@ -635,10 +1173,8 @@ class Gui(wx.Frame):
         self.switches_text = wx.StaticText(self, wx.ID_ANY, _("Manage Switches"))
 
         self.switches_id_list = devices.find_devices(devices.SWITCH)
-        self.switches_list = []
-        for id in self.switches_id_list:
-            name = names.get_name_string(id)
-            self.switches_list.append(name)
+        self.switches_list = [names.get_name_string(switch_id)
+                              for switch_id in self.switches_id_list]
 
         self.switches = wx.Choice(self, wx.ID_ANY, choices=self.switches_list)
         self.switch_setting = wx.Choice(self, wx.ID_ANY, choices=["0", "1"])
@@ -648,8 +1184,8 @@ class Gui(wx.Frame):
 
         self.monitors_text = wx.StaticText(self, wx.ID_ANY, _("Manage Monitors"))
 
-        self.monitored_list = monitors.get_signal_names()[0]
-        self.unmonitored_list = monitors.get_signal_names()[1]
+        [self.monitored_list,
+         self.unmonitored_list] = monitors.get_signal_names()
 
         self.monitored = wx.Choice(self, wx.ID_ANY, choices=self.monitored_list)
         self.not_monitored = wx.Choice(self, wx.ID_ANY, choices=self.unmonitored_list)
@@ -731,34 +1267,30 @@ class Gui(wx.Frame):
 
     def on_menu(self, event):
         """Handle the event when the user selects a menu item."""
-        print("Menu button pressed\n")
         Id = event.GetId()
         if Id == wx.ID_EXIT:
             self.Close(True)
         if Id == wx.ID_HELP_CONTEXT:
-            text = _("EBNF Button Pressed")
-            print("EBNF Button Pressed\n")
+            text = self.ebnf_message
             self.write_to_dialogue(text)
-            ebnf_box = wx.GenericMessageDialog(None, self.EBNF_text,
-                                               _("Rules for the user definition file."),
+            ebnf_box = wx.GenericMessageDialog(None, EBNF_TEXT,
+                                               self.ebnf_title,
                                                wx.ICON_INFORMATION)
             ebnf_box.ShowModal()
 
         if Id == wx.ID_HELP:
-            text = _("Help button pressed.")
-            self.dialogue_box.write("{} \n \n".format(text))
-            self.dialogue_box.write("{} \n \n".format(self.help_text))
+            self.dialogue_buffer.append(self.help_block)
+            self.flush_dialogue()
         if Id == wx.ID_ABOUT:
             wx.MessageBox("""Logic Simulator
                           \nCreated by James Thompson, Anna Mills and Neelay Sant\n2021""",
-                          _("About Logsim"), wx.ICON_INFORMATION | wx.OK)
+                          self.about_title, wx.ICON_INFORMATION | wx.OK)
 
     def on_spin(self, event):
         """Handle the event when the user changes the spin control value."""
         spin_value = self.spin.GetValue()
         self.spin_value = spin_value
-        text = _("New spin control value: {} \n").format(str(spin_value))
-        print("New spin control value: {} \n".format(str(spin_value)))
+        text = self.spin_message.format(spin_value)
         self.write_to_dialogue(text)
 
     def on_run_button(self, event):
@@ -766,16 +1298,19 @@ class Gui(wx.Frame):
 
         Run the simulation from scratch.
         """
-        self.cycles_completed = 0
         cycles = self.spin_value
+        if cycles is None:  # the number of cycles provided is invalid
+            return
 
-        if cycles is not None:  # if the number of cycles provided is valid
-            self.monitors.reset_monitors()
-            text = _("Running for {} cycles\n").format(str(cycles))
-            print(("Running for {} cycles\n").format(str(cycles)))
-            self.devices.cold_startup()
-            if self.run_network(cycles):
-                self.cycles_completed += cycles
+        self.cycles_completed = 0
+        self.monitors.reset_monitors()
+        # the signals restart, so a rerun of the same length draws new values
+        self.canvas.clear_signal_arrays()
+        self.canvas.clear_trace_cache()
+        text = self.run_message.format(cycles)
+        self.devices.cold_startup()
+        if self.run_network(cycles):
+            self.cycles_completed += cycles
 
         self.canvas.render()
         self.write_to_dialogue(text)
@@ -786,19 +1321,20 @@ class Gui(wx.Frame):
         Continue a previously run simulation.
         """
         cycles = self.spin_value
-        if cycles is not None:  # if the number of cycles provided is valid
-            if self.cycles_completed == 0:
-                text = _("Error! Nothing to continue. Run first.\n")
-                print("Error! Nothing to continue. Run first.\n")
-            elif self.run_network(cycles):
-                self.cycles_completed += cycles
-                text = _("Continuing for {} cycles. \nTotal: {} \n").format(
-                    str(cycles), str(self.cycles_completed))
-                print(("Continuing for {} cycles. \nTotal: {} \n").format(
-                    str(cycles), str(self.cycles_completed)))
-
+        if cycles is None:  # the number of cycles provided is invalid
+            return
+        if self.cycles_completed == 0:  # nothing has changed, so no redraw
+            self.write_to_dialogue(self.nothing_to_continue_message)
+            return
+
+        # run_network reports an oscillating network itself, but the
+        # partial trace is still drawn
+        if self.run_network(cycles):
+            self.cycles_completed += cycles
+            text = self.continue_message.format(cycles,
+                                                self.cycles_completed)
+            self.write_to_dialogue(text)
         self.canvas.render()
-        self.write_to_dialogue(text)
 
     def on_switch_button(self, event):
         """Handle the event when the user clicks the switch button.
@@ -806,18 +1342,16 @@ class Gui(wx.Frame):
         Set the specified switch to the specified signal level.
         """
         switch_index = self.switches.GetSelection()
-        switch_id = self.switches_id_list[switch_index]
+        switch_state = self.switch_setting.GetSelection()
+        if wx.NOT_FOUND in (switch_index, switch_state):  # nothing selected
+            self.write_to_dialogue(self.invalid_switch_message)
+            return
 
-        if switch_id is not None:
-            choice = int(self.switch_setting.GetSelection())
-            switch_state = choice
-            if switch_state is not None:
-                if self.devices.set_switch(switch_id, switch_state):
-                    text = _("Successfully set switch.")
-                    print("Successfully set switch.\n")
-                else:
-                    text = _("Error! Invalid switch.")
-                    print("Error! Invalid switch.\n")
+        switch_id = self.switches_id_list[switch_index]
+        if self.devices.set_switch(switch_id, switch_state):
+            text = self.switch_set_message
+        else:
+            text = self.invalid_switch_message
 
         self.write_to_dialogue(text)
 
@@ -826,75 +1360,61 @@ class Gui(wx.Frame):
 
         Remove the specified monitor.
         """
-        try:
-            monitor_name = self.monitored.GetString(self.monitored.GetSelection())
-        except Exception:
-            text = _("Error! Could not zap monitor.")
-            print("Error! Could not zap monitor.\n")
+        selection = self.monitored.GetSelection()
+        if selection == wx.NOT_FOUND:  # no monitor chosen
+            text = self.zap_error_message
             self.write_to_dialogue(text)
             return False
+        monitor_name = self.monitored.GetString(selection)
         monitor = self.get_monitor_IDs(monitor_name)
 
-        # attempt to zap monitor once IDs have been found.
-
-        if monitor is not None:
-            [device, port] = monitor
-            if self.monitors.remove_monitor(device, port):
-                text = _("Successfully zapped monitor")
-                print("Successfully zapped monitor\n")
-            else:
-                text = _("Error! Could not zap monitor.")
-                print("Error! Could not zap monitor.\n")
+        # attempt to zap monitor once IDs have been found, and only redraw
+        # and reset the lists if the monitors changed.
+        [device, port] = monitor
+        if self.monitors.remove_monitor(device, port):
+            text = self.zapped_message
+            self.refresh_monitors()
+        else:
+            text = self.zap_error_message
 
-        self.canvas.render()
         self.write_to_dialogue(text)
-        self.reset_monitor_lists()
 
     def on_add_button(self, event):
         """Handle the event when the user clicks the run button.
 
         Set the specified monitor.
         """
-        try:
-            monitor_name = self.not_monitored.GetString(self.not_monitored.GetSelection())
-        except Exception:
-            text = _("Error! Could not make monitor.")
-            print("Error! Could not make monitor.\n")
+        selection = self.not_monitored.GetSelection()
+        if selection == wx.NOT_FOUND:  # no monitor chosen
+            text = self.make_error_message
             self.write_to_dialogue(text)
             return False
+        monitor_name = self.not_monitored.GetString(selection)
         monitor = self.get_monitor_IDs(monitor_name)
 
-        # attempt to make monitor once IDs have been found.
-
-        if monitor is not None:
-            [device, port] = monitor
-            monitor_error = self.monitors.make_monitor(device, port, self.cycles_completed)
-            if monitor_error == self.monitors.NO_ERROR:
-                text = _("Successfully made monitor.")
-                print("Successfully made monitor.\n")
-            else:
-                text = _("Error! Could not make monitor.")
-                print("Error! Could not make monitor.\n")
+        # attempt to make monitor once IDs have been found, and only redraw
+        # and reset the lists if the monitors changed.
+        [device, port] = monitor
+        monitor_error = self.monitors.make_monitor(device, port, self.cycles_completed)
+        if monitor_error == self.monitors.NO_ERROR:
+            text = self.made_message
+            self.refresh_monitors()
+        else:
+            text = self.make_error_message
 
-        self.canvas.render()
         self.write_to_dialogue(text)
-        self.reset_monitor_lists()
 
     def get_monitor_IDs(self, monitor_name):
-        """Extract monitor's device and port IDs and return them."""
-        device_name_list = []
-        port_name_list = []
-        is_device = True  # keep track of when '.' is hit.
-        for i in monitor_name:
-            if i.isalnum() is True and is_device is True:
-                device_name_list.append(i)
-            elif i.isalnum() is True:
-                port_name_list.append(i)
-            else:
-                is_device = False
+        """Extract monitor's device and port IDs and return them.
 
-        device_name = ''.join(device_name_list)
-        port_name = ''.join(port_name_list)
+        Resolved IDs are cached by name, as name IDs never change.
+        """
+        if monitor_name in self.monitor_IDs:
+            return self.monitor_IDs[monitor_name]
+
+        # monitor names have the form device or device.port
+        device_name, dot, port_name = NOT_NAME_CHARACTER.sub(
+            '', monitor_name).partition('.')
 
         device_id = self.names.query(device_name)
         if port_name == '':
@@ -903,58 +1423,107 @@ class Gui(wx.Frame):
             port_id = self.names.query(port_name)
 
         monitor = [device_id, port_id]
+        if device_id is not None:
+            self.monitor_IDs[monitor_name] = monitor
         return monitor
 
+    def refresh_monitors(self):
+        """Redraw the canvas and reset the monitor lists after a change."""
+        # monitors shift position when one is added or zapped, so geometry
+        # cached for the old layout would never be drawn again
+        self.canvas.clear_name_cache()
+        self.canvas.clear_signal_arrays()  # a new monitor starts a new list
+        self.canvas.clear_trace_cache()
+        self.canvas.render()
+        self.reset_monitor_lists()
+
     def reset_monitor_lists(self):
         """Reset lists available to add and zap monitors from."""
-        self.monitored.Clear()
-        self.monitored_list = self.monitors.get_signal_names()[0]
-        self.monitored.SetItems(self.monitored_list)
-
-        self.not_monitored.Clear()
-        self.unmonitored_list = self.monitors.get_signal_names()[1]
-        self.not_monitored.SetItems(self.unmonitored_list)
+        [monitored_list,
+         unmonitored_list] = self.monitors.get_signal_names()
+
+        # SetItems replaces the existing items, so the controls are updated
+        # in place without clearing them first. Only changed lists are set,
+        # and the frame is frozen so both updates share one repaint.
+        self.Freeze()
+        if monitored_list != self.monitored_list:
+            self.monitored_list = monitored_list
+            self.monitored.SetItems(monitored_list)
+        if unmonitored_list != self.unmonitored_list:
+            self.unmonitored_list = unmonitored_list
+            self.not_monitored.SetItems(unmonitored_list)
+        self.Thaw()
 
     def write_to_dialogue(self, text):
-        """Write text to the dialogue box and print to the console."""
-        self.dialogue_box.write("{} \n".format(text))
+        """Queue text for the dialogue box.
+
+        Messages queued while handling one event are written together once
+        control returns to the event loop.
+        """
+        if not self.dialogue_buffer:  # first message since the last flush
+            wx.CallAfter(self.flush_dialogue)
+        self.dialogue_buffer.append(text + " \n")
+
+    def flush_dialogue(self):
+        """Write all queued text to the dialogue box in one call."""
+        if self.dialogue_buffer:
+            # one repaint for the text and the scroll to the end
+            self.dialogue_box.Freeze()
+            self.dialogue_box.AppendText("".join(self.dialogue_buffer))
+            self.dialogue_box.Thaw()
+            self.dialogue_buffer = []
 
     def on_toggle_view_button(self, event):
         """Handle the user requesting to change between 2D and 3D view."""
-        text = _("Toggle view button pressed")
+        text = self.toggle_message
         self.write_to_dialogue(text)
 
-        self.canvas.reset_transformation_variables()
-        self.canvas.init = False
-
-        # handle the change of view
-
-        if self.canvas.choose_3D is False:
-            self.canvas.choose_3D = True
-            self.canvas.pan_x = -300  # move origin to be visible on init
-            self.canvas.pan_y = 300
-        else:
-            self.canvas.choose_3D = False
-            self.canvas.__init__(self.scrollable, wx.DefaultPosition,
-                                 wx.Size(1000, 1000), self.devices, self.monitors)
-        self.canvas.render()
+        self.canvas.set_mode(not self.canvas.choose_3D)
 
     def run_network(self, cycles):
         """Run the network for the specified number of simulation cycles.
 
         Return True if successful.
         """
-        for i in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
+        # bind the per-cycle methods once, outside the loop
+        execute_network = self.network.execute_network
+        record_signals = self.monitors.record_signals
+        for _ in range(cycles):
+            if execute_network():
+                record_signals()
             else:
-                text = _("Error! Network oscillating.")
-                print("Error! Network oscillating.\n")
+                text = self.oscillating_message
                 self.write_to_dialogue(text)
                 return False
-        self.monitors.display_signals()
         return True
 
+    def define_messages(self):
+        """Translate the dialogue box messages and dialog titles once.
+
+        Event handlers reuse these rather than looking up the translation
+        catalogue on every click.
+        """
+        self.ebnf_message = _("EBNF Button Pressed")
+        self.ebnf_title = _("Rules for the user definition file.")
+        self.about_title = _("About Logsim")
+        self.help_message = _("Help button pressed.")
+        self.spin_message = _("New spin control value: {} \n")
+        self.run_message = _("Running for {} cycles\n")
+        self.nothing_to_continue_message = _(
+            "Error! Nothing to continue. Run first.\n")
+        self.continue_message = _("Continuing for {} cycles. \nTotal: {} \n")
+        self.switch_set_message = _("Successfully set switch.")
+        self.invalid_switch_message = _("Error! Invalid switch.")
+        self.toggle_message = _("Toggle view button pressed")
+        self.oscillating_message = _("Error! Network oscillating.")
+        self.zapped_message = _("Successfully zapped monitor")
+        self.zap_error_message = _("Error! Could not zap monitor.")
+        self.made_message = _("Successfully made monitor.")
+        self.make_error_message = _("Error! Could not make monitor.")
+
+        # the help menu writes its message and the help text as one block
+        self.help_block = f"{self.help_message} \n \n{self.help_text} \n \n"
+
     def define_long_texts(self):
         """Initialise long texts used in the GUI."""
         self.help_text = _(u"""HELP MENU: \n
@@ -973,38 +1542,3 @@ When in 2D view, holding 'left' or 'right' click and dragging will translate the
 When in 3D view, holding 'right click' and dragging will translate the view.
 Holding 'left click' and dragging will rotate the view. \n
 Scrolling in either view will zoom in and out.""")
-
-        self.EBNF_text = """EBNF RULES:
-
-digit = “0” | “1” | “2” | “3” | “4” | “5” | “6” | “7” | “8” | “9” ;
-
-letter = "A" | "B" | "C" | "D" | "E" | "F" | "G"
-       | "H" | "I" | "J" | "K" | "L" | "M" | "N"
-       | "O" | "P" | "Q" | "R" | "S" | "T" | "U"
-       | "V" | "W" | "X" | "Y" | "Z" | "a" | "b"
-       | "c" | "d" | "e" | "f" | "g" | "h" | "i"
-       | "j" | "k" | "l" | "m" | "n" | "o" | "p"
-       | "q" | "r" | "s" | "t" | "u" | "v" | "w"
-       | "x" | "y" | "z" ;
-
-file = {definition | connection | monitor}, "END" ;
-
-definition =  “define”, name, {name}, “as”,
- ( “XOR” | “DTYPE” | switch | gate | clock | generator), “;” ;
-name = letter, {letter | digit} ;
-switch = “SWITCH”, (“0” | “1”), “state” ;
-gate = (“NAND” | “AND” | “OR” | “NOR” ), digit, {digit}, “inputs”;
-clock = “CLOCK”, “period”, digit, {digit} ;
-generator = "SIGGEN", ("0"|"1"), "for", digit, {digit}, "cycles",
-{("0" | "1"), "for", digit, {digit}, "cycles"} ;
-
-connection = “connect”, output, “to”, input, “;” ;
-output = name, [“.Q” | “.QBAR”] ;
-input = name, “.”, (“DATA” | “CLK” | “SET” | “CLEAR” | “I”, digit, {digit}) ;
-
-monitor = “monitor”, output, {output}, “;” ;
-
-Comments:
-Line comments must be started with a '%' and ended by a newline.
-Paragraph comments must be enclosed between two '#' characters.
-"""
@@ -56,6 +56,14 @@ class Monitors:
         # {(device_id, output_id): [signal_list]}
         self.monitors_dictionary = collections.OrderedDict()
 
+        # signal name lists, kept until a monitor or device is added or removed
+        self.signal_names = None
+        self.named_device_count = None
+
+        # longest monitor name length, kept until a monitor is added or removed
+        self.margin = None
+        self.margin_valid = False
+
         [self.NO_ERROR, self.NOT_OUTPUT,
          self.MONITOR_PRESENT] = self.names.unique_error_codes(3)
 
@@ -78,6 +86,8 @@ class Monitors:
             # list.
             self.monitors_dictionary[(device_id, output_id)] = [
                 self.devices.BLANK] * cycles_completed
+            self.signal_names = None
+            self.margin_valid = False
             return self.NO_ERROR
 
     def remove_monitor(self, device_id, output_id):
@@ -89,6 +99,8 @@ class Monitors:
             return False
         else:
             del self.monitors_dictionary[(device_id, output_id)]
+            self.signal_names = None
+            self.margin_valid = False
             return True
 
     def get_monitor_signal(self, device_id, output_id):
@@ -106,13 +118,24 @@ class Monitors:
 
         This function is called at every simulation cycle.
         """
-        for device_id, output_id in self.monitors_dictionary:
-            signal_level = self.get_monitor_signal(device_id, output_id)
-            self.monitors_dictionary[(device_id,
-                                      output_id)].append(signal_level)
+        get_output_signal = self.network.get_output_signal
+        for (device_id, output_id), signal_list in \
+                self.monitors_dictionary.items():
+            # every key is a monitor, so the output is read directly
+            signal_list.append(get_output_signal(device_id, output_id))
 
     def get_signal_names(self):
-        """Return two signal name lists: monitored and not monitored."""
+        """Return two signal name lists: monitored and not monitored.
+
+        The lists are cached and rebuilt only after monitors are made or
+        removed, or devices are added. Copies are returned, so callers may
+        change them freely.
+        """
+        device_count = len(self.devices.devices_list)
+        if (self.signal_names is not None
+                and self.named_device_count == device_count):
+            return [list(signal_list) for signal_list in self.signal_names]
+
         non_monitored_signal_list = []
         monitored_signal_list = []
         for device_id, output_id in self.monitors_dictionary:
@@ -127,40 +150,43 @@ class Monitors:
                                                                output_id)
                     non_monitored_signal_list.append(signal_name)
 
-        return [monitored_signal_list, non_monitored_signal_list]
+        self.signal_names = [monitored_signal_list, non_monitored_signal_list]
+        self.named_device_count = device_count
+        return [list(monitored_signal_list), list(non_monitored_signal_list)]
 
     def reset_monitors(self):
         """Clear the memory of all the monitors.
 
         The list of stored signal levels for each monitor is deleted.
         """
-        for device_id, output_id in self.monitors_dictionary:
-            self.monitors_dictionary[(device_id, output_id)] = []
+        for signal_list in self.monitors_dictionary.values():
+            signal_list.clear()
 
     def get_margin(self):
         """Return the length of the longest monitor's name.
 
         Return None if no signals are being monitored. This is useful for
         finding out how much space to leave after each monitor's name before
-        starting to draw the signal trace.
+        starting to draw the signal trace. The result is kept until a monitor
+        is added or removed, as it is needed on every redraw.
         """
-        length_list = []  # for storing name lengths
-        for device_id, output_id in self.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            name_length = len(monitor_name)
-            length_list.append(name_length)
-        if length_list:  # if the list is not empty
-            return max(length_list)
-        else:
-            return None
+        if not self.margin_valid:
+            length_list = []  # for storing name lengths
+            for device_id, output_id in self.monitors_dictionary:
+                monitor_name = self.devices.get_signal_name(device_id,
+                                                            output_id)
+                length_list.append(len(monitor_name))
+            self.margin = max(length_list, default=None)
+            self.margin_valid = True
+        return self.margin
 
     def display_signals(self):
         """Display the signal trace(s) in the text console."""
         margin = self.get_margin()
-        for device_id, output_id in self.monitors_dictionary:
+        for (device_id, output_id), signal_list in \
+                self.monitors_dictionary.items():
             monitor_name = self.devices.get_signal_name(device_id, output_id)
             name_length = len(monitor_name)
-            signal_list = self.monitors_dictionary[(device_id, output_id)]
             print(monitor_name + (margin - name_length) * " ", end=": ")
             for signal in signal_list:
                 if signal == self.devices.HIGH:
@@ -33,13 +33,18 @@ class Names:
     lookup(self, name_string_list): Returns a list of name IDs for each
                         name string. Adds a name if not already present.
 
+    lookup_existing(self, name_string_list): Returns a list of name IDs for
+                        each name string, with None for absent names. Does not
+                        add any names.
+
     get_name_string(self, name_id): Returns the corresponding name string for
                         the name ID. Returns None if the ID is not present.
     """
 
     def __init__(self):
-        """Initialise names list."""
+        """Initialise names list and its index."""
         self.names_list = []
+        self.names_dict = {}  # maps each name string to its index in the list
         self.error_code_count = 0  # how many error codes have been declared
 
     # edited pre-written method to include ValueError
@@ -59,10 +64,7 @@ class Names:
         If the name string is not present in the names list, return None.
         """
         if isinstance(name_string, str):
-            try:
-                return self.names_list.index(name_string)
-            except ValueError:  # exception thrown if name not in list
-                return None
+            return self.names_dict.get(name_string)
         else:
             raise TypeError("Expected name_string to be string.")
 
@@ -73,19 +75,38 @@ class Names:
         """
         if isinstance(name_string_list, list):
             name_id_list = []
+            # bind the attribute lookups once, outside the loop
+            names_dict = self.names_dict
+            names_list = self.names_list
             for name_string in name_string_list:
                 if isinstance(name_string, str):
-                    try:
-                        name_id_list.append(self.names_list.index(name_string))
-                    except ValueError:  # exception thrown if name not in list
-                        self.names_list.append(name_string)
-                        name_id_list.append(len(self.names_list) - 1)
+                    name_id = names_dict.get(name_string)
+                    if name_id is None:  # name not yet in list
+                        name_id = len(names_list)
+                        names_list.append(name_string)
+                        names_dict[name_string] = name_id
+                    name_id_list.append(name_id)
                 else:
                     raise TypeError("Expected list item to be string.")
             return name_id_list
         else:
             raise TypeError("Expected name_string_list to be list.")
 
+    def lookup_existing(self, name_string_list):
+        """Return a list of name IDs for each name string in name_string_list.
+
+        If a name string is not present in the names list, its ID is None.
+        Unlike lookup, no names are added.
+        """
+        if isinstance(name_string_list, list):
+            for name_string in name_string_list:
+                if not isinstance(name_string, str):
+                    raise TypeError("Expected list item to be string.")
+            return [self.names_dict.get(name_string)
+                    for name_string in name_string_list]
+        else:
+            raise TypeError("Expected name_string_list to be list.")
+
     def get_name_string(self, name_id):
         """Return the corresponding name string for name_id.
 
@@ -59,6 +59,9 @@ class Network:
     update_siggens(self): If it is time to do so, set sig. gen. signals to RISING
                           or FALLING.
 
+    get_device_group(self, device_kind): Returns the cached list of device
+                                         IDs of the specified kind.
+
     execute_network(self): Executes all the devices in the network for one
                            simulation cycle.
     """
@@ -73,6 +76,20 @@ class Network:
          self.DEVICE_ABSENT] = self.names.unique_error_codes(6)
         self.steady_state = True  # for checking if signals have settled
 
+        # signal reached by update_signal, keyed by (current signal, whether
+        # the target is LOW)
+        LOW, HIGH = self.devices.LOW, self.devices.HIGH
+        RISING, FALLING = self.devices.RISING, self.devices.FALLING
+        self.signal_updates = {
+            (LOW, True): LOW, (LOW, False): RISING,
+            (FALLING, True): LOW, (FALLING, False): RISING,
+            (HIGH, True): FALLING, (HIGH, False): HIGH,
+            (RISING, True): FALLING, (RISING, False): HIGH}
+
+        # device IDs of each kind, regrouped only when devices are added
+        self.device_groups = {}
+        self.grouped_device_count = None
+
     def get_connected_output(self, device_id, input_id):
         """Return the output connected to the given input.
 
@@ -173,17 +190,9 @@ class Network:
         Return updated signal, and set steady_state to false if the new signal
         is different from the old signal.
         """
-        if signal in [self.devices.LOW, self.devices.FALLING]:
-            if target == self.devices.LOW:
-                new_signal = self.devices.LOW
-            else:
-                new_signal = self.devices.RISING
-        elif signal in [self.devices.HIGH, self.devices.RISING]:
-            if target == self.devices.LOW:
-                new_signal = self.devices.FALLING
-            else:
-                new_signal = self.devices.HIGH
-        else:
+        new_signal = self.signal_updates.get(
+            (signal, target == self.devices.LOW))
+        if new_signal is None:  # signal is not LOW, HIGH, RISING or FALLING
             return None
         if signal != new_signal:
             self.steady_state = False
@@ -335,7 +344,7 @@ class Network:
 
     def update_siggens(self):
         """If it is time to do so, set sig. gen. signals to RISING or FALLING."""
-        siggen_devices = self.devices.find_devices(self.devices.SIGGEN)
+        siggen_devices = self.get_device_group(self.devices.SIGGEN)
         for device_id in siggen_devices:
             device = self.devices.get_device(device_id)
             output_signal = self.get_output_signal(device_id, output_id=None)
@@ -350,7 +359,7 @@ class Network:
 
     def update_clocks(self):
         """If it is time to do so, set clock signals to RISING or FALLING."""
-        clock_devices = self.devices.find_devices(self.devices.CLOCK)
+        clock_devices = self.get_device_group(self.devices.CLOCK)
         for device_id in clock_devices:
             device = self.devices.get_device(device_id)
             if device.clock_counter == device.clock_half_period:
@@ -363,21 +372,35 @@ class Network:
                     device.outputs[None] = self.devices.RISING
             device.clock_counter += 1
 
+    def get_device_group(self, device_kind):
+        """Return the cached list of device IDs of the specified kind.
+
+        Devices are only ever added, so the groups are rebuilt whenever the
+        device count changes rather than on every simulation cycle.
+        """
+        device_count = len(self.devices.devices_list)
+        if self.grouped_device_count != device_count:
+            device_kinds = self.devices.gate_types + self.devices.device_types
+            self.device_groups = {kind: self.devices.find_devices(kind)
+                                  for kind in device_kinds}
+            self.grouped_device_count = device_count
+        return self.device_groups[device_kind]
+
     def execute_network(self):
         """Execute all the devices in the network for one simulation cycle.
 
         Return True if successful and the network does not oscillate.
         """
-        clock_devices = self.devices.find_devices(self.devices.CLOCK)
-        siggen_devices = self.devices.find_devices(self.devices.SIGGEN)
+        clock_devices = self.get_device_group(self.devices.CLOCK)
+        siggen_devices = self.get_device_group(self.devices.SIGGEN)
         clock_siggen_devices = clock_devices + siggen_devices
-        switch_devices = self.devices.find_devices(self.devices.SWITCH)
-        d_type_devices = self.devices.find_devices(self.devices.D_TYPE)
-        and_devices = self.devices.find_devices(self.devices.AND)
-        or_devices = self.devices.find_devices(self.devices.OR)
-        nand_devices = self.devices.find_devices(self.devices.NAND)
-        nor_devices = self.devices.find_devices(self.devices.NOR)
-        xor_devices = self.devices.find_devices(self.devices.XOR)
+        switch_devices = self.get_device_group(self.devices.SWITCH)
+        d_type_devices = self.get_device_group(self.devices.D_TYPE)
+        and_devices = self.get_device_group(self.devices.AND)
+        or_devices = self.get_device_group(self.devices.OR)
+        nand_devices = self.get_device_group(self.devices.NAND)
+        nor_devices = self.get_device_group(self.devices.NOR)
+        xor_devices = self.get_device_group(self.devices.XOR)
 
         # This sets clock signals to RISING or FALLING, where necessary
         self.update_clocks()
@@ -0,0 +1,173 @@
+"""Test the geometry built by the canvas in the gui module.
+
+The canvas is built on stub wx and OpenGL modules, so no window or OpenGL
+context is needed and only the NumPy geometry is tested.
+"""
+import importlib.util
+import os
+import sys
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+
+
+class StubGLCanvas:
+    """Stand in for wx.glcanvas.GLCanvas without creating a window."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def GetClientSize(self):
+        return (0, 0)
+
+    def Bind(self, *args):
+        pass
+
+
+def load_gui():
+    """Import the gui module with stub wx and OpenGL modules.
+
+    The stubs are only in sys.modules during the import, so other tests
+    still see the real modules.
+    """
+    wx = mock.MagicMock()
+    wx.Frame = object
+    wx.glcanvas.GLCanvas = StubGLCanvas
+    opengl = mock.MagicMock()
+    stubs = {"wx": wx, "wx.glcanvas": wx.glcanvas, "OpenGL": opengl,
+             "OpenGL.GL": opengl.GL, "OpenGL.GLU": opengl.GLU,
+             "OpenGL.GLUT": opengl.GLUT}
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gui.py")
+    spec = importlib.util.spec_from_file_location("stub_gui", path)
+    gui = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, stubs):
+        spec.loader.exec_module(gui)
+    return gui
+
+
+MyGLCanvas = load_gui().MyGLCanvas
+
+
+@pytest.fixture
+def canvas():
+    """Return a canvas showing two switch monitors with set signal lists."""
+    names = Names()
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network)
+
+    [SW1_ID, SW2_ID] = names.lookup(["Sw1", "Sw2"])
+    devices.make_device(SW1_ID, devices.SWITCH, 0)
+    devices.make_device(SW2_ID, devices.SWITCH, 0)
+    monitors.make_monitor(SW1_ID, None)
+    monitors.make_monitor(SW2_ID, None)
+
+    HIGH = devices.HIGH
+    LOW = devices.LOW
+    BLANK = devices.BLANK
+    monitors.monitors_dictionary[(SW1_ID, None)] = [HIGH, HIGH, LOW, BLANK,
+                                                    LOW, LOW]
+    monitors.monitors_dictionary[(SW2_ID, None)] = [LOW, LOW, LOW]
+
+    return MyGLCanvas(None, None, None, devices, monitors)
+
+
+def test_get_trace_vertices(canvas):
+    """Test if get_trace_vertices merges runs and breaks them at BLANK."""
+    signals = canvas.get_signal_matrix()
+
+    vertices, vertex_counts = canvas.get_trace_vertices(signals, 0)
+
+    # Sw1 is HIGH for two cycles, LOW for one, BLANK, then LOW for two. Sw2 is
+    # LOW for three cycles, one row of 50 further down.
+    assert vertices.dtype == np.float32
+    assert vertices.tolist() == [[40, 75], [80, 75], [80, 100], [100, 100],
+                                 [120, 100], [160, 100],
+                                 [40, 150], [100, 150]]
+    assert vertex_counts.tolist() == [6, 2]
+    assert vertex_counts.sum() == len(vertices)
+
+    # The margin moves every trace right by 10 per character
+    vertices, vertex_counts = canvas.get_trace_vertices(signals, 3)
+    assert vertices[:, 0].tolist() == [70, 110, 110, 130, 150, 190, 70, 130]
+
+
+def test_get_signal_array(canvas):
+    """Test if get_signal_array extends and clears the cached arrays."""
+    devices = canvas.devices
+    HIGH = devices.HIGH
+    LOW = devices.LOW
+    monitors_dictionary = canvas.monitors.monitors_dictionary
+    [SW2_ID] = canvas.monitors.names.lookup(["Sw2"])
+    signal_list = monitors_dictionary[(SW2_ID, None)]
+
+    signals = canvas.get_signal_array(SW2_ID, None, signal_list)
+    assert signals.dtype == np.uint8
+    assert signals.tolist() == [LOW, LOW, LOW]
+
+    # Continuing the simulation only appends the new cycles
+    signal_list.extend([HIGH, LOW])
+    assert canvas.get_signal_array(SW2_ID, None, signal_list).tolist() == [
+        LOW, LOW, LOW, HIGH, LOW]
+
+    # A rerun with the same number of cycles is encoded afresh once the
+    # cached arrays are cleared
+    signal_list = [HIGH] * 5
+    canvas.clear_signal_arrays()
+    assert canvas.get_signal_array(SW2_ID, None, signal_list).tolist() == [
+        HIGH] * 5
+
+
+def test_get_signal_matrix(canvas):
+    """Test if get_signal_matrix pads the shorter signal lists with BLANK."""
+    devices = canvas.devices
+    HIGH = devices.HIGH
+    LOW = devices.LOW
+    BLANK = devices.BLANK
+
+    signals = canvas.get_signal_matrix()
+
+    assert signals.dtype == np.uint8
+    assert signals.tolist() == [[HIGH, HIGH, LOW, BLANK, LOW, LOW],
+                                [LOW, LOW, LOW, BLANK, BLANK, BLANK]]
+
+
+def test_get_cuboid_geometry(canvas):
+    """Test if get_cuboid_geometry places a cuboid for each drawn sample."""
+    signals = canvas.get_signal_matrix()
+
+    rows, z_positions, heights = canvas.get_cuboid_geometry(signals)
+
+    # BLANK samples are skipped and the z origin is in the middle of the
+    # six cycles
+    assert rows.tolist() == [0, 0, 0, 0, 0, 1, 1, 1]
+    assert z_positions.tolist() == [-60, -40, -20, 20, 40, -60, -40, -20]
+    assert heights.tolist() == [11, 11, 1, 1, 1, 1, 1, 1]
+
+
+def test_get_cuboid_mesh(canvas):
+    """Test if get_cuboid_mesh moves and scales the unit cuboid correctly."""
+    signals = canvas.get_signal_matrix()
+    x_positions = [-20, 0]
+
+    mesh = canvas.get_cuboid_mesh(signals, x_positions)
+
+    # 24 interleaved vertices and normals for each of the 8 drawn samples
+    assert mesh.dtype == np.float32
+    assert mesh.shape == (8 * 24, 6)
+
+    cuboids = mesh.reshape(8, 24, 6)
+    rows, z_positions, heights = canvas.get_cuboid_geometry(signals)
+    for cuboid, row, z, height in zip(cuboids, rows, z_positions, heights):
+        x = x_positions[row]
+        assert cuboid[:, :3].min(axis=0).tolist() == [x - 5, -6, z - 10]
+        assert cuboid[:, :3].max(axis=0).tolist() == [x + 5, height - 6,
+                                                      z + 10]
+        assert np.array_equal(cuboid[:, 3:], canvas.cuboid_normals)
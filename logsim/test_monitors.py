@@ -82,12 +82,26 @@ def test_get_signal_names(new_monitors):
     devices = new_monitors.devices
     [D_ID] = names.lookup(["D1"])
 
-    # Create a D-type device
+    assert new_monitors.get_signal_names() == [["Sw1", "Sw2", "Or1"], []]
+
+    # The cached lists are rebuilt after a device is made
     devices.make_device(D_ID, devices.D_TYPE)
 
+    signal_names = new_monitors.get_signal_names()
+    assert signal_names == [["Sw1", "Sw2", "Or1"], ["D1.Q", "D1.QBAR"]]
+
+    # Changing the returned lists leaves the cached lists unchanged
+    signal_names[0].append("D1.Q")
+    signal_names[1].remove("D1.Q")
     assert new_monitors.get_signal_names() == [["Sw1", "Sw2", "Or1"],
                                                ["D1.Q", "D1.QBAR"]]
 
+    # The cached lists are rebuilt after a monitor is removed
+    [OR1_ID] = names.lookup(["Or1"])
+    new_monitors.remove_monitor(OR1_ID, None)
+    assert new_monitors.get_signal_names() == [["Sw1", "Sw2"],
+                                               ["Or1", "D1.Q", "D1.QBAR"]]
+
 
 def test_record_signals(new_monitors):
     """Test if record_signals records the correct signals."""
@@ -135,6 +149,12 @@ def test_get_margin(new_monitors):
     # Longest name should be Dtype1.QBAR
     assert new_monitors.get_margin() == 11
 
+    # The kept margin must follow monitors being removed
+    new_monitors.remove_monitor(D_ID, QBAR_ID)
+    assert new_monitors.get_margin() == 8
+    new_monitors.remove_monitor(D_ID, Q_ID)
+    assert new_monitors.get_margin() == 3  # Sw1, Sw2 and Or1 are left
+
 
 def test_reset_monitors(new_monitors):
     """Test if reset_monitors clears the signal lists of all the monitors."""
@@ -69,6 +69,24 @@ def test_lookup(used_names, name_string, expected_id):
     assert used_names.lookup(["Andrew"]) == [3]
 
 
+def test_lookup_repeated_names(new_names):
+    """Test if lookup adds a name repeated within one list only once"""
+    assert new_names.lookup(["Anna", "Bob", "Anna"]) == [0, 1, 0]
+    assert new_names.query("Bob") == 1
+    assert new_names.get_name_string(2) is None
+
+
+def test_lookup_existing(used_names):
+    """Test if lookup_existing returns ids without adding names"""
+    assert used_names.lookup_existing(["Neelay", "Bob", "James"]) == [2, None,
+                                                                      0]
+    assert used_names.query("Bob") is None
+    with pytest.raises(TypeError):
+        used_names.lookup_existing("James")
+    with pytest.raises(TypeError):
+        used_names.lookup_existing([1.4])
+
+
 def test_unique_error_codes_raises_exceptions(used_names):
     """Test if unique_error_codes raises expected exceptions."""
     with pytest.raises(TypeError):
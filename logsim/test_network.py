@@ -115,6 +115,24 @@ def test_check_network(network_with_devices):
     assert len(network.check_network()) == 0
 
 
+def test_get_device_group(network_with_devices):
+    """Test if device groups are rebuilt after a device is added."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, SW3_ID] = names.lookup(["Sw1", "Sw2", "Or1",
+                                                     "Sw3"])
+
+    assert network.get_device_group(devices.SWITCH) == [SW1_ID, SW2_ID]
+    assert network.get_device_group(devices.OR) == [OR1_ID]
+    assert network.get_device_group(devices.AND) == []
+
+    devices.make_device(SW3_ID, devices.SWITCH, 1)
+    assert network.get_device_group(devices.SWITCH) == [SW1_ID, SW2_ID,
+                                                        SW3_ID]
+
+
 def test_make_connection(network_with_devices):
     """Test if the make_connection function correctly connects devices."""
     network = network_with_devices
@@ -12,7 +12,7 @@ from monitors import Monitors
 from parse import Parser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser():
     """Return an instance of a scanner using."""
     print("\nNow opening file...")
@@ -22,13 +22,9 @@ def parser():
 
     file_list = ["example1.txt", "example1_with_syntax_errors.txt",
                  "error2.txt", "error1.txt", "example_SIGGEN.txt", "error_SIGGEN.txt"]
+    paths = [os.path.join(cwd, item) for item in file_list]
     parser_list = []
-    for item in file_list:
-        if '/' in cwd:
-            path = cwd + '/' + item
-        else:
-            path = cwd + '\\' + item
-
+    for path in paths:
         names = Names()
         scanner = Scanner(path, names)
         devices = Devices(names)
@@ -101,8 +97,8 @@ def test_connections(parser):
     names = parser[0].names
     network = parser[0].network
 
-    [SW1_ID, SW2_ID, G1_ID, G2_ID, I1, I2] = names.lookup(["SW1", "SW2", "G1",
-                                                           "G2", "I1", "I2"])
+    [SW1_ID, SW2_ID, G1_ID, G2_ID, I1, I2] = names.lookup_existing(
+        ["SW1", "SW2", "G1", "G2", "I1", "I2"])
 
     assert network.get_connected_output(G1_ID, I1) == (SW1_ID, None)
     assert network.get_connected_output(G2_ID, I2) == (SW2_ID, None)
@@ -110,7 +106,7 @@ def test_connections(parser):
 
 def test_monitor_list(parser):
     """Test parser has created the correct monitors."""
-    [G1_ID, G2_ID] = parser[0].names.lookup(["G1", "G2"])
+    [G1_ID, G2_ID] = parser[0].names.lookup_existing(["G1", "G2"])
     assert len(parser[0].monitors.monitors_dictionary) == 2
     assert (G1_ID, None) in parser[0].monitors.monitors_dictionary
     assert (G2_ID, None) in parser[0].monitors.monitors_dictionary
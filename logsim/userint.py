@@ -7,6 +7,10 @@ Classes:
 --------
 UserInterface - reads and parses user commands.
 """
+import re
+
+# the alphanumeric characters, as accepted by str.isalnum, continuing a name
+NAME_TAIL = re.compile(r"[^\W_]*")
 
 
 class UserInterface:
@@ -131,13 +135,15 @@ class UserInterface:
     def read_string(self):
         """Return the next alphanumeric string."""
         self.skip_spaces()
-        name_string = ""
         if not self.character.isalpha():  # the string must start with a letter
             print("Error! Expected a name.")
             return None
-        while self.character.isalnum():
-            name_string = "".join([name_string, self.character])
-            self.get_character()
+        # slice the whole name out of the line in one match, then move on to
+        # the character after it
+        end = NAME_TAIL.match(self.line, self.cursor).end()
+        name_string = self.line[self.cursor - 1:end]
+        self.cursor = end
+        self.get_character()
         return name_string
 
     def read_name(self):
@@ -177,14 +183,18 @@ class UserInterface:
         range.
         """
         self.skip_spaces()
-        number_string = ""
         if not self.character.isdigit():
             print("Error! Expected a number.")
             return None
-        while self.character.isdigit():
-            number_string = "".join([number_string, self.character])
-            self.get_character()
-        number = int(number_string)
+        # find the end of the digits and slice them out of the line, rather
+        # than building the number string a character at a time
+        start = self.cursor - 1
+        end = self.cursor
+        while end < len(self.line) and self.line[end].isdigit():
+            end += 1
+        self.cursor = end
+        self.get_character()
+        number = int(self.line[start:end])
 
         if upper_bound is not None:
             if number > upper_bound:
@@ -247,9 +257,12 @@ class UserInterface:
 
         Return True if successful.
         """
+        # bind the per-cycle methods once, outside the loop
+        execute_network = self.network.execute_network
+        record_signals = self.monitors.record_signals
         for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
+            if execute_network():
+                record_signals()
             else:
                 print("Error! Network oscillating.")
                 return False
@@ -263,7 +276,7 @@ class UserInterface:
 
         if cycles is not None:  # if the number of cycles provided is valid
             self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycles), " cycles"]))
+            print(f"Running for {cycles} cycles")
             self.devices.cold_startup()
             if self.run_network(cycles):
                 self.cycles_completed += cycles
@@ -276,5 +289,5 @@ class UserInterface:
                 print("Error! Nothing to continue. Run first.")
             elif self.run_network(cycles):
                 self.cycles_completed += cycles
-                print(" ".join(["Continuing for", str(cycles), "cycles.",
-                                "Total:", str(self.cycles_completed)]))
+                print(f"Continuing for {cycles} cycles. "
+                      f"Total: {self.cycles_completed}")